@@ -1,6 +1,7 @@
 from __future__ import annotations as _annotations
 
 from typing import TYPE_CHECKING as _TYPE_CHECKING
+import functools as _functools
 from pathlib import Path as _Path
 
 import pylinks as _pl
@@ -27,7 +28,7 @@ def generate_default(
     title_gen: Callable[[str], str] = lambda keyword: _pl.string.camel_to_title(keyword),
     code_gen: Callable[
         [dict | list | str | float | int | bool], str
-    ] = lambda value: _ps.write.to_yaml_string(value, end_of_file_newline=False).strip(),
+    ] = _functools.partial(_ps.write.to_yaml_string, end_of_file_newline=False),
     code_language: str = "yaml",
     class_prefix: str = "jsonschema-",
     keyword_title_prefix: str = "",
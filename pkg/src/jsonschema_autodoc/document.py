@@ -268,7 +268,7 @@ class DocumentGenerator:
             key=key
         )
         body = self._page_gen.generate(
-            page_type=_pl.string.camel_to_snake(key),
+            page_type=_meta.KEYWORD_SNAKE_CASE[key],
             schema=schema,
             schema_uri=schema_uri_index,
             instance_jsonpath=instance_jsonpath,
@@ -1,3 +1,6 @@
+import pylinks as _pl
+
+
 class Key:
 
     # comments
@@ -116,6 +119,12 @@ ARRAY_KEYWORDS = [
     Key.UNIQUE_ITEMS,
 ]
 
+KEYWORD_SNAKE_CASE: dict[str, str] = {
+    keyword: _pl.string.camel_to_snake(keyword.removeprefix("$"))
+    for name, keyword in vars(Key).items() if not name.startswith("_")
+}
+"""Mapping of keywords to their snake_case names (without the `$` prefix), e.g., `readOnly` to `read_only`."""
+
 
 #
 # from __future__ import annotations as _annotations
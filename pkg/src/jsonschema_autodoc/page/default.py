@@ -1,6 +1,8 @@
 from __future__ import annotations as _annotations
 
 from typing import TYPE_CHECKING as _TYPE_CHECKING
+from dataclasses import dataclass as _dataclass, replace as _replace
+import functools as _functools
 import re as _re
 
 import mdit as _mdit
@@ -15,6 +17,65 @@ if _TYPE_CHECKING:
     from jsonschema_autodoc.protocol import JSONSchemaRegistry
 
 
+_SLUG_TABLE = bytes(
+    ord(char.lower()) if char.isascii() and char.isalnum() else ord("-")
+    for char in map(chr, range(256))
+)
+"""Translation table mapping ASCII letters to lowercase and all other bytes to hyphens."""
+_SLUG_DASHES = _re.compile(rb"-{2,}")
+
+
+def _to_slug(string: str) -> str:
+    """Convert a string to a URL-friendly slug.
+
+    This gives the same result as `pylinks.string.to_slug`,
+    but handles ASCII strings (i.e., all keywords, class names and most URIs)
+    with a single byte translation instead of unicode normalization and regex substitution.
+    """
+    if not string.isascii():
+        return _pl.string.to_slug(string)
+    return _SLUG_DASHES.sub(b"-", string.encode("ascii").translate(_SLUG_TABLE)).strip(b"-").decode("ascii")
+
+
+_ASCII_PUNCTUATION_CHARS = r'!"#$%&\'()*+,\-./:;<=>?@[\\]^_`{|}~'
+_ASCII_PUNCTUATION = _re.compile(f'([{_re.escape(_ASCII_PUNCTUATION_CHARS)}])')
+"""Pattern matching any ASCII punctuation character, for escaping in Markdown."""
+
+
+@_dataclass(frozen=True, slots=True)
+class BadgeSpec:
+    """Specification of the badge for a schema keyword.
+
+    Attributes
+    ----------
+    title
+        Title (i.e., tooltip) of the badge, as either a fixed string,
+        a mapping from the truth value of the keyword's value to a string,
+        or a function taking the keyword's value and returning a string.
+        If not provided, the badge has no title
+        (unless one is defined in the schema).
+    message
+        Badge message, or a function taking the keyword's value and returning it.
+        If not provided, the message is derived from the keyword's value.
+    message_complex
+        Message (or function returning the message) for values
+        that are not booleans, arrays, numbers or strings.
+    value
+        Fixed value to use instead of the keyword's value.
+    true_is_permissive
+        Whether a `true` value is permissive, i.e., should use the permissive badge configuration.
+    link
+        Whether the badge links to the keyword's anchor:
+        `"always"`, only when the value is a `"schema"`, or never (`None`).
+    """
+    title: str | dict[bool, str] | Callable[[Any], str] | None = None
+    message: str | Callable[[Any], str] | None = None
+    message_complex: str | Callable[[Any], str] = len
+    value: Any = None
+    true_is_permissive: bool = False
+    link: Literal["always", "schema"] | None = None
+
+
 class DefaultPageGenerator:
     """Single schema generator.
 
@@ -26,12 +87,280 @@ class DefaultPageGenerator:
         A dictionary mapping schema keywords to keyword-specific badge configurations.
     """
 
+    __slots__ = (
+        "_registry",
+        "_key_title_gen",
+        "_value_code_gen",
+        "_value_code_language",
+        "_ref_name_gen",
+        "_keyword_title_prefix",
+        "_keyword_title_suffix",
+        "_keyword_description_prefix",
+        "_keyword_description_suffix",
+        "_class_prefix",
+        "_class_name_cache",
+        "_title_key_cache",
+        "_description_key_cache",
+        "_ref_cache",
+        "_badge_config_default",
+        "_badge_config_permissive",
+        "_badge_config_restrictive",
+        "_badges_header_default",
+        "_badges_inline_default",
+        "_badges_classes",
+        "_badges_empty",
+        "_schema",
+        "_schema_uri",
+        "_instance_jsonpath",
+    )
+
+    _BADGE_KEYS: tuple[str, ...] = (
+        _meta.Key.DEPRECATED,
+        _meta.Key.READ_ONLY,
+        _meta.Key.WRITE_ONLY,
+        _meta.Key.DEFAULT,
+        _meta.Key.TYPE,
+        # string
+        _meta.Key.FORMAT,
+        _meta.Key.CONTENT_MEDIA_TYPE,
+        _meta.Key.CONTENT_ENCODING,
+        _meta.Key.MIN_LENGTH,
+        _meta.Key.MAX_LENGTH,
+        # number
+        _meta.Key.MINIMUM,
+        _meta.Key.EXCLUSIVE_MINIMUM,
+        _meta.Key.MAXIMUM,
+        _meta.Key.EXCLUSIVE_MAXIMUM,
+        _meta.Key.MULTIPLE_OF,
+        # array
+        _meta.Key.MIN_ITEMS,
+        _meta.Key.MAX_ITEMS,
+        _meta.Key.MIN_CONTAINS,
+        _meta.Key.MAX_CONTAINS,
+        _meta.Key.UNIQUE_ITEMS,
+        _meta.Key.UNEVALUATED_ITEMS,
+        # object
+        _meta.Key.MIN_PROPERTIES,
+        _meta.Key.MAX_PROPERTIES,
+        _meta.Key.UNEVALUATED_PROPERTIES,
+        # complex
+        _meta.Key.REQUIRED,
+        _meta.Key.DEPENDENT_REQUIRED,
+        _meta.Key.CONST,
+        _meta.Key.ENUM,
+        _meta.Key.PATTERN,
+        _meta.Key.CONTENT_SCHEMA,
+        _meta.Key.PREFIX_ITEMS,
+        _meta.Key.ITEMS,
+        _meta.Key.CONTAINS,
+        _meta.Key.PROPERTIES,
+        _meta.Key.PATTERN_PROPERTIES,
+        _meta.Key.ADDITIONAL_PROPERTIES,
+        _meta.Key.PROPERTY_NAMES,
+        _meta.Key.DEPENDENT_SCHEMAS,
+        _meta.Key.ALL_OF,
+        _meta.Key.ONE_OF,
+        _meta.Key.ANY_OF,
+        _meta.Key.NOT,
+        _meta.Key.IF,
+        _meta.Key.REF,
+    )
+    """Schema keywords with a badge, in the order they appear in the badge list."""
+
+    _TAB_KEYS: tuple[str, ...] = (
+        _meta.Key.DEFAULT,
+        _meta.Key.REQUIRED,
+        _meta.Key.DEPENDENT_REQUIRED,
+        _meta.Key.CONST,
+        _meta.Key.PATTERN,
+        _meta.Key.ENUM,
+        _meta.Key.EXAMPLES,
+    )
+    """Schema keywords with a tab, in the order they appear in the tab set."""
+
+    _BADGE_SPECS: dict[str, BadgeSpec] = {
+        _meta.Key.DEPRECATED: BadgeSpec(
+            title={True: "This value is deprecated.", False: "This value is not deprecated."},
+        ),
+        _meta.Key.READ_ONLY: BadgeSpec(
+            title={True: "This value is read-only.", False: "This value is not read-only."},
+        ),
+        _meta.Key.WRITE_ONLY: BadgeSpec(
+            title={True: "This value is write-only.", False: "This value is not write-only."},
+        ),
+        _meta.Key.DEFAULT: BadgeSpec(
+            title="This value has a default.",
+            value=True,
+            true_is_permissive=True,
+            link="always",
+        ),
+        _meta.Key.TYPE: BadgeSpec(
+            title=lambda value: (
+                f"This value must have one of the following data types: {", ".join(value)}."
+                if isinstance(value, list) else
+                f"This value must be of type {value}."
+            ),
+        ),
+        _meta.Key.FORMAT: BadgeSpec(
+            title=lambda value: f"This value must be a string with '{value}' format.",
+        ),
+        _meta.Key.CONTENT_MEDIA_TYPE: BadgeSpec(
+            title=lambda value: f"This value must be a string with '{value}' MIME type.",
+        ),
+        _meta.Key.CONTENT_ENCODING: BadgeSpec(
+            title=lambda value: f"This value must be a string with '{value}' encoding.",
+        ),
+        _meta.Key.MIN_LENGTH: BadgeSpec(
+            title=lambda value: f"This value must be a string with a minimum length of {value}.",
+        ),
+        _meta.Key.MAX_LENGTH: BadgeSpec(
+            title=lambda value: f"This value must be a string with a maximum length of {value}.",
+        ),
+        _meta.Key.MINIMUM: BadgeSpec(
+            title=lambda value: f"This value must be greater than or equal to {value}.",
+        ),
+        _meta.Key.EXCLUSIVE_MINIMUM: BadgeSpec(
+            title=lambda value: f"This value must be greater than {value}.",
+        ),
+        _meta.Key.MAXIMUM: BadgeSpec(
+            title=lambda value: f"This value must be smaller than or equal to {value}.",
+        ),
+        _meta.Key.EXCLUSIVE_MAXIMUM: BadgeSpec(
+            title=lambda value: f"This value must be smaller than {value}.",
+        ),
+        _meta.Key.MULTIPLE_OF: BadgeSpec(
+            title=lambda value: f"This value must be a multiple of {value}.",
+        ),
+        _meta.Key.MIN_ITEMS: BadgeSpec(
+            title=lambda value: f"This array must contain {value} or more elements.",
+        ),
+        _meta.Key.MAX_ITEMS: BadgeSpec(
+            title=lambda value: f"This array must contain {value} or less elements.",
+        ),
+        _meta.Key.MIN_CONTAINS: BadgeSpec(
+            title=lambda value: f"This array must contain {value} or more elements conforming to the `contains` schema.",
+            link="always",
+        ),
+        _meta.Key.MAX_CONTAINS: BadgeSpec(
+            title=lambda value: f"This array must contain {value} or less elements conforming to the `contains` schema.",
+            link="always",
+        ),
+        _meta.Key.UNIQUE_ITEMS: BadgeSpec(
+            title={True: "All array elements must be unique.", False: "Array elements do not need to be unique."},
+        ),
+        _meta.Key.UNEVALUATED_ITEMS: BadgeSpec(
+            title=lambda value: (
+                f"Array elements other than those defined in `items`, `prefixItems`, or `contains` are {"" if value else "not "}allowed."
+                if isinstance(value, bool) else
+                f"Array elements other than those defined in `items`, `prefixItems`, or `contains` must conform to a separate schema."
+            ),
+            message_complex="Defined",
+            true_is_permissive=True,
+            link="schema",
+        ),
+        _meta.Key.MIN_PROPERTIES: BadgeSpec(
+            title=lambda value: f"This object must contain {value} or more properties.",
+        ),
+        _meta.Key.MAX_PROPERTIES: BadgeSpec(
+            title=lambda value: f"This object must contain {value} or less properties.",
+        ),
+        _meta.Key.UNEVALUATED_PROPERTIES: BadgeSpec(
+            title=lambda value: (
+                f"Unevaluated object properties are {"" if value else "not "}allowed."
+                if isinstance(value, bool) else
+                f"Unevaluated object properties must conform to a separate schema."
+            ),
+            message_complex="Defined",
+            true_is_permissive=True,
+            link="schema",
+        ),
+        _meta.Key.REQUIRED: BadgeSpec(
+            title=lambda value: f"This object has {len(value)} required properties.",
+            message=lambda value: str(len(value)),
+            link="always",
+        ),
+        _meta.Key.DEPENDENT_REQUIRED: BadgeSpec(
+            title=lambda value: f"This object has {sum(len(reqs) for reqs in value.values())} required properties depending on {len(value)} other properties.",
+            message=lambda value: str(len(value)),
+            link="always",
+        ),
+        _meta.Key.CONST: BadgeSpec(
+            title="This value is a constant.",
+            value=True,
+            link="always",
+        ),
+        _meta.Key.ENUM: BadgeSpec(
+            title="This value must be equal to one of the enumerated values.",
+            value=True,
+            link="always",
+        ),
+        _meta.Key.PATTERN: BadgeSpec(
+            title="This string must match a RegEx pattern.",
+            value=True,
+            link="always",
+        ),
+        _meta.Key.CONTENT_SCHEMA: BadgeSpec(
+            title="This media content has a defined schema.",
+            value=True,
+            link="always",
+        ),
+        _meta.Key.PREFIX_ITEMS: BadgeSpec(
+            title=lambda value: f"The first {len(value)} elements of this array are individually defined.",
+            message=lambda value: str(len(value)),
+            link="always",
+        ),
+    }
+    """Badge specifications of keywords that do not have a dedicated `_badge_*` method."""
+
+    _BADGE_DISPATCH: tuple[tuple[str, Callable], ...] = ()
+    _TAB_DISPATCH: tuple[tuple[str, Callable], ...] = ()
+    _BADGE_DISPATCH_KEYS: frozenset[str] = frozenset()
+    _TAB_DISPATCH_KEYS: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_dispatch()
+        return
+
+    @classmethod
+    def _build_dispatch(cls) -> None:
+        """Resolve the badge and tab generator of each keyword once per class."""
+        cls._BADGE_DISPATCH = cls._make_dispatch(prefix="_badge_", keys=cls._BADGE_KEYS, specs=cls._BADGE_SPECS)
+        cls._TAB_DISPATCH = cls._make_dispatch(prefix="_tab_", keys=cls._TAB_KEYS)
+        cls._BADGE_DISPATCH_KEYS = frozenset(key for key, _ in cls._BADGE_DISPATCH)
+        cls._TAB_DISPATCH_KEYS = frozenset(key for key, _ in cls._TAB_DISPATCH)
+        return
+
+    @classmethod
+    def _make_dispatch(
+        cls,
+        prefix: str,
+        keys: tuple[str, ...],
+        specs: dict[str, BadgeSpec] | None = None,
+    ) -> tuple[tuple[str, Callable], ...]:
+        """Map keywords to functions taking the generator instance.
+
+        Dedicated methods (e.g., `_badge_ref`) take precedence;
+        keywords without one are handled by `_make_keyword_badge_kwargs`
+        according to their specification in `specs`, if any.
+        """
+        dispatch = []
+        specs = specs or {}
+        for key in keys:
+            snake_case_key = _meta.KEYWORD_SNAKE_CASE.get(key) or _pl.string.camel_to_snake(key.removeprefix("$"))
+            method = getattr(cls, f"{prefix}{snake_case_key}", None)
+            if not method and key in specs:
+                method = _functools.partial(cls._make_keyword_badge_kwargs, key=key, spec=specs[key])
+            if method:
+                dispatch.append((key, method))
+        return tuple(dispatch)
+
     def __init__(
         self,
         registry: JSONSchemaRegistry | None = None,
         ref_name_gen: Callable[[str, dict], str] = lambda ref_id, schema: schema.get("title", ref_id),
         title_gen: Callable[[str], str] = lambda keyword: _pl.string.camel_to_title(keyword.removeprefix("$")),
-        code_gen: Callable[[dict | list | str | float | int | bool], str] = lambda value: _ps.write.to_yaml_string(value, end_of_file_newline=False).strip(),
+        code_gen: Callable[[dict | list | str | float | int | bool], str] = _functools.partial(_ps.write.to_yaml_string, end_of_file_newline=False),
         code_language: str = "yaml",
         class_prefix: str = "jsonschema-",
         keyword_title_prefix: str = "",
@@ -55,6 +384,10 @@ class DefaultPageGenerator:
         self._keyword_description_prefix = keyword_description_prefix
         self._keyword_description_suffix = keyword_description_suffix
         self._class_prefix = class_prefix
+        self._class_name_cache: dict[tuple[str, ...], str] = {}
+        self._title_key_cache: dict[str, str] = {}
+        self._description_key_cache: dict[str, str] = {}
+        self._ref_cache: dict[tuple[str, str], tuple[str, str]] = {}
         self._badge_config_default = badge or {}
         self._badge_config_permissive = badge_permissive or {"color": "#00802B"}
         self._badge_config_restrictive = badge_restrictive or {"color": "#AF1F10"}
@@ -76,6 +409,11 @@ class DefaultPageGenerator:
         _ps.update.recursive_update(source=self._badges_inline_default, addon=badges)
         for badge_config in (self._badges_header_default, self._badges_inline_default):
             badge_config["classes"] = sorted(list(set(badge_config["classes"])))
+        self._badges_classes = {
+            inline: [self._make_class_name("badges"), self._make_class_name("badges", "inline" if inline else "header")]
+            for inline in (True, False)
+        }
+        self._badges_empty = {inline: self._make_badges(items=[], inline=inline) for inline in (True, False)}
 
         self._schema: dict = {}
         self._schema_uri: str = ""
@@ -105,18 +443,18 @@ class DefaultPageGenerator:
         resolver = self._registry.resolver()
         for ref, uris in refs.items():
             ref_schema = resolver.lookup(ref)
-            out.append(f"- [{ref_schema.contents.get("title", ref)}](#{_pl.string.to_slug(ref)})")
+            out.append(f"- [{ref_schema.contents.get("title", ref)}](#{_to_slug(ref)})")
             for uri in uris:
-                out.append(f"  - [{uri}](#{_pl.string.to_slug(uri)})")
+                out.append(f"  - [{uri}](#{_to_slug(uri)})")
         return {"list": "\n".join(out)}
 
     def generate_index(self, paths: dict[str, list[str]], instance_id_prefix: str):
         out = []
         for path, uris in sorted(paths.items()):
-            instance_id = _pl.string.to_slug(f"{instance_id_prefix}{path}")
+            instance_id = _to_slug(f"{instance_id_prefix}{path}")
             out.append(f"- [`{path}`]{{#{instance_id}}}")
             for uri in uris:
-                out.append(f"  - [{self._escape(uri.removesuffix("#"))}](#{_pl.string.to_slug(uri)})")
+                out.append(f"  - [{self._escape(uri.removesuffix("#"))}](#{_to_slug(uri)})")
         intro = f"This schema defines {len(paths)} unique paths:"
         return {"intro": intro, "list": "\n".join(out)}
 
@@ -138,6 +476,8 @@ class DefaultPageGenerator:
         schema = self._schema
         schema_uri = self._schema_uri
         out = {"div_open": f'<div class="{self._make_class_name("deflist")}">'}
+        key_attrs = {"class": "key"}
+        summary_attrs = {"class": "summary"}
         for key in ("if", "then", "else"):
             self._schema = schema.get(key)
             if not self._schema:
@@ -152,9 +492,9 @@ class DefaultPageGenerator:
                 _mdit.element.html(
                     tag="div",
                     content=f"[{key.title()}](#{self._make_tag(key)})",
-                    attrs={"class": "key"}
+                    attrs=key_attrs
                 ),
-                _mdit.element.html("div", list_item_body, attrs={"class": "summary"}),
+                _mdit.element.html("div", list_item_body, attrs=summary_attrs),
                 content_separator="\n"
             )
             out[key] = entry
@@ -166,6 +506,8 @@ class DefaultPageGenerator:
         schema_uri = self._schema_uri
         props_key = _meta.Key.PATTERN_PROPERTIES if pattern else _meta.Key.PROPERTIES
         instance_jsonpath = self._instance_jsonpath
+        key_attrs = {"class": self._make_class_name("deflist", "key")}
+        summary_attrs = {"class": self._make_class_name("deflist", "summary")}
         for key, sub_schema in self._schema[props_key].items():
             self._schema = sub_schema
             self._schema_uri = f"{schema_uri}/{key}"
@@ -181,9 +523,8 @@ class DefaultPageGenerator:
                 list_item_body.append(title)
             out[f"prop_{key}"] = (
                 _mdit.container(
-                    _mdit.element.html("div", f"[`{key}`](#{self._make_tag()})",
-                                       attrs={"class": self._make_class_name("deflist", "key")}),
-                    _mdit.element.html("div", list_item_body, attrs={"class": self._make_class_name("deflist", "summary")}),
+                    _mdit.element.html("div", f"[`{key}`](#{self._make_tag()})", attrs=key_attrs),
+                    _mdit.element.html("div", list_item_body, attrs=summary_attrs),
                     content_separator="\n"
                 )
             )
@@ -192,66 +533,16 @@ class DefaultPageGenerator:
 
     def _generate_badges(self, inline: bool):
         badge_items = []
-        for key in (
-            _meta.Key.DEPRECATED,
-            _meta.Key.READ_ONLY,
-            _meta.Key.WRITE_ONLY,
-            _meta.Key.DEFAULT,
-            _meta.Key.TYPE,
-            # string
-            _meta.Key.FORMAT,
-            _meta.Key.CONTENT_MEDIA_TYPE,
-            _meta.Key.CONTENT_ENCODING,
-            _meta.Key.MIN_LENGTH,
-            _meta.Key.MAX_LENGTH,
-            # number
-            _meta.Key.MINIMUM,
-            _meta.Key.EXCLUSIVE_MINIMUM,
-            _meta.Key.MAXIMUM,
-            _meta.Key.EXCLUSIVE_MAXIMUM,
-            _meta.Key.MULTIPLE_OF,
-            # array
-            _meta.Key.MIN_ITEMS,
-            _meta.Key.MAX_ITEMS,
-            _meta.Key.MIN_CONTAINS,
-            _meta.Key.MAX_CONTAINS,
-            _meta.Key.UNIQUE_ITEMS,
-            _meta.Key.UNEVALUATED_ITEMS,
-            # object
-            _meta.Key.MIN_PROPERTIES,
-            _meta.Key.MAX_PROPERTIES,
-            _meta.Key.UNEVALUATED_PROPERTIES,
-            # complex
-            _meta.Key.REQUIRED,
-            _meta.Key.DEPENDENT_REQUIRED,
-            _meta.Key.CONST,
-            _meta.Key.ENUM,
-            _meta.Key.PATTERN,
-
-            _meta.Key.CONTENT_SCHEMA,
-
-            _meta.Key.PREFIX_ITEMS,
-            _meta.Key.ITEMS,
-            _meta.Key.CONTAINS,
-
-            _meta.Key.PROPERTIES,
-            _meta.Key.PATTERN_PROPERTIES,
-            _meta.Key.ADDITIONAL_PROPERTIES,
-            _meta.Key.PROPERTY_NAMES,
-            _meta.Key.DEPENDENT_SCHEMAS,
-
-            _meta.Key.ALL_OF,
-            _meta.Key.ONE_OF,
-            _meta.Key.ANY_OF,
-            _meta.Key.NOT,
-            _meta.Key.IF,
-            _meta.Key.REF,
-        ):
-            method_name = f"_badge_{_pl.string.camel_to_snake(key.removeprefix("$"))}"
-            if hasattr(self, method_name):
-                badge_item = getattr(self, method_name)()
-                if badge_item:
-                    badge_items.append(badge_item)
+        present_keys = self._BADGE_DISPATCH_KEYS & self._schema.keys()
+        if present_keys:
+            for key, method in self._BADGE_DISPATCH:
+                if key in present_keys:
+                    badge_item = method(self)
+                    if badge_item:
+                        badge_items.append(badge_item)
+        if not badge_items:
+            # Rendering is read-only, so the same empty badge element can be shared.
+            return self._badges_empty[inline]
         return self._make_badges(items=badge_items, inline=inline)
 
     def _generate_tabs(self):
@@ -259,17 +550,11 @@ class DefaultPageGenerator:
         tab_jsonpath = self._tab_jsonpath()
         if tab_jsonpath:
             tab_items.append(tab_jsonpath)
-        for key in (
-            _meta.Key.DEFAULT,
-            _meta.Key.REQUIRED,
-            _meta.Key.DEPENDENT_REQUIRED,
-            _meta.Key.CONST,
-            _meta.Key.PATTERN,
-            _meta.Key.ENUM,
-            _meta.Key.EXAMPLES
-        ):
-            if key in self._schema:
-                tab_items.append(getattr(self, f"_tab_{_pl.string.camel_to_snake(key)}")())
+        present_keys = self._TAB_DISPATCH_KEYS & self._schema.keys()
+        if present_keys:
+            for key, method in self._TAB_DISPATCH:
+                if key in present_keys:
+                    tab_items.append(method(self))
         tab_items.append(self._tab_jsonschema())
         return _mdit.element.tab_set(content=tab_items, classes=[self._make_class_name("tab-set")])
 
@@ -289,252 +574,22 @@ class DefaultPageGenerator:
             description, html_container="div", html_container_attrs={"class": self._make_class_name(key)}
         ) if description else None
 
-    def _badge_deprecated(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.DEPRECATED,
-            title=lambda value: f"This value is {"" if value else "not "}deprecated."
-        )
-
-    def _badge_read_only(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.READ_ONLY,
-            title=lambda value: f"This value is {"" if value else "not "}read-only."
-        )
-
-    def _badge_write_only(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.WRITE_ONLY,
-            title=lambda value: f"This value is {"" if value else "not "}write-only."
-        )
-
-    def _badge_type(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.TYPE,
-            title=lambda value: (
-                f"This value must have one of the following data types: {", ".join(value)}."
-                if isinstance(value, list) else
-                f"This value must be of type {value}."
-            )
-        )
-
-    def _badge_format(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.FORMAT,
-            title=lambda value: f"This value must be a string with '{value}' format."
-        )
-
-    def _badge_content_media_type(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.CONTENT_MEDIA_TYPE,
-            title=lambda value: f"This value must be a string with '{value}' MIME type."
-        )
-
-    def _badge_content_encoding(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.CONTENT_ENCODING,
-            title=lambda value: f"This value must be a string with '{value}' encoding."
-        )
-
-    def _badge_min_length(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MIN_LENGTH,
-            title=lambda value: f"This value must be a string with a minimum length of {value}."
-        )
-
-    def _badge_max_length(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MAX_LENGTH,
-            title=lambda value: f"This value must be a string with a maximum length of {value}."
-        )
-
-    def _badge_minimum(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MINIMUM,
-            title=lambda value: f"This value must be greater than or equal to {value}."
-        )
-
-    def _badge_exclusive_minimum(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.EXCLUSIVE_MINIMUM,
-            title=lambda value: f"This value must be greater than {value}."
-        )
-
-    def _badge_maximum(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MAX_LENGTH,
-            title=lambda value: f"This value must be smaller than or equal to {value}."
-        )
-
-    def _badge_exclusive_maximum(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.EXCLUSIVE_MAXIMUM,
-            title=lambda value: f"This value must be smaller than {value}."
-        )
-
-    def _badge_multiple_of(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MULTIPLE_OF,
-            title=lambda value: f"This value must be a multiple of {value}."
-        )
-
-    def _badge_min_items(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MIN_ITEMS,
-            title=lambda value: f"This array must contain {value} or more elements."
-        )
-
-    def _badge_max_items(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MAX_ITEMS,
-            title=lambda value: f"This array must contain {value} or less elements."
-        )
-
-    def _badge_min_contains(self):
-        key = _meta.Key.MIN_CONTAINS
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            title=lambda value: f"This array must contain {value} or more elements conforming to the `contains` schema.",
-            link=f"#{self._make_tag(key)}"
-        )
-
-    def _badge_max_contains(self):
-        key = _meta.Key.MAX_CONTAINS
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            title=lambda value: f"This array must contain {value} or less elements conforming to the `contains` schema.",
-            link=f"#{self._make_tag(key)}"
-        )
-
-    def _badge_unique_items(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.UNIQUE_ITEMS,
-            title=lambda value: "All array elements must be unique." if value else "Array elements do not need to be unique.",
-        )
-
-    def _badge_unevaluated_items(self):
-        key = _meta.Key.UNEVALUATED_ITEMS
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            message_complex=lambda value: "Defined",
-            true_is_permissive=True,
-            title=lambda value: (
-                f"Array elements other than those defined in `items`, `prefixItems`, or `contains` are {"" if value else "not "}allowed."
-                if isinstance(value, bool) else
-                f"Array elements other than those defined in `items`, `prefixItems`, or `contains` must conform to a separate schema."
-            ),
-            link=lambda value: f"#{self._make_tag(key)}" if isinstance(value, dict) else None
-        )
-
-    def _badge_min_properties(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MIN_PROPERTIES,
-            title=lambda value: f"This object must contain {value} or more properties."
-        )
-
-    def _badge_max_properties(self):
-        return self._make_keyword_badge_kwargs(
-            key=_meta.Key.MAX_PROPERTIES,
-            title=lambda value: f"This object must contain {value} or less properties."
-        )
-
-    def _badge_unevaluated_properties(self):
-        key = _meta.Key.UNEVALUATED_PROPERTIES
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            message_complex=lambda value: "Defined",
-            true_is_permissive=True,
-            title=lambda value: (
-                f"Unevaluated object properties are {"" if value else "not "}allowed."
-                if isinstance(value, bool) else
-                f"Unevaluated object properties must conform to a separate schema."
-            ),
-            link=lambda value: f"#{self._make_tag(key)}" if isinstance(value, dict) else None
-        )
-
-    def _badge_default(self):
-        key = _meta.Key.DEFAULT
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            value=True,
-            true_is_permissive=True,
-            title="This value has a default.",
-            link=f"#{self._make_tag(key)}",
-        )
-
-    def _badge_required(self):
-        key = _meta.Key.REQUIRED
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            message=lambda value: str(len(value)),
-            title=lambda value: f"This object has {value} required properties.",
-            link=f"#{self._make_tag(key)}",
-        )
-
-    def _badge_dependent_required(self):
-        key = _meta.Key.DEPENDENT_REQUIRED
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            message=lambda value: str(len(value)),
-            title=lambda value: f"This object has {sum(len(reqs) for reqs in value.values())} required properties depending on {len(value)} other properties.",
-            link=f"#{self._make_tag(key)}",
-        )
-
-    def _badge_const(self):
-        key = _meta.Key.CONST
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            value=True,
-            title="This value is a constant.",
-            link=f"#{self._make_tag(key)}",
-        )
-
-    def _badge_pattern(self):
-        key = _meta.Key.PATTERN
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            value=True,
-            title="This string must match a RegEx pattern.",
-            link=f"#{self._make_tag(key)}",
-        )
-
-    def _badge_enum(self):
-        key = _meta.Key.ENUM
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            value=True,
-            title="This value must be equal to one of the enumerated values.",
-            link=f"#{self._make_tag(key)}",
-        )
-
-    def _badge_content_schema(self):
-        key = _meta.Key.CONTENT_SCHEMA
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            value=True,
-            title="This media content has a defined schema.",
-            link=f"#{self._make_tag(key)}",
-        )
-
-    def _badge_prefix_items(self):
-        key = _meta.Key.PREFIX_ITEMS
-        return self._make_keyword_badge_kwargs(
-            key=key,
-            message=lambda value: str(len(value)),
-            title=lambda value: f"The first {value} elements of this array are individually defined.",
-            link=f"#{self._make_tag(key)}",
-        )
-
     def _badge_ref(self) -> dict | None:
         key = _meta.Key.REF
         ref_id: str = self._schema.get(key)
         if not ref_id:
             return
         ref_uri = _schema.resolve_ref(ref_id, self._schema_uri)
-        ref_schema = self._registry.resolver().lookup(ref_uri).contents
+        cache_key = (ref_id, ref_uri)
+        cached = self._ref_cache.get(cache_key)
+        if cached is None:
+            ref_schema = self._registry.resolver().lookup(ref_uri).contents
+            cached = self._ref_cache[cache_key] = (self._ref_name_gen(ref_id, ref_schema), f"#{_to_slug(ref_uri)}")
+        ref_name, link = cached
         return self._make_badge_kwargs(
             key=key,
-            message=self._ref_name_gen(ref_id, ref_schema),
-            link=f"#{_pl.string.to_slug(ref_uri)}",
+            message=ref_name,
+            link=link,
             title=f"This schema references another schema with ID '{ref_id}'."
         )
 
@@ -613,7 +668,6 @@ class DefaultPageGenerator:
         return self._make_tab_item_array(_meta.Key.EXAMPLES)
 
     def _tab_jsonschema(self):
-
         sanitized_schema = _schema.sanitize(self._schema)
         yaml_dropdown = _mdit.element.dropdown(
             title="YAML",
@@ -654,40 +708,64 @@ class DefaultPageGenerator:
         return _mdit.element.attribute(
             badges,
             block=True,
-            classes=[self._make_class_name("badges"), self._make_class_name("badges", "inline" if inline else "header")]
+            classes=self._badges_classes[inline],
         )
 
     def _make_keyword_badge_kwargs(
         self,
         key: str,
-        message: Callable[[Any], str] | str | None = None,
-        value: Any = None,
-        true_is_permissive: bool = False,
-        message_complex: Callable[[Any], str] | str = lambda value: len(value),
-        title: Callable[[Any], str] | str | None = None,
+        spec: BadgeSpec | None = None,
+        *,
         link: Callable[[Any], str] | str | None = None,
+        **spec_kwargs,
     ) -> dict | None:
+        """Create badge keyword arguments for a schema keyword.
+
+        Overrides written against the previous signature can still pass
+        `message`, `value`, `true_is_permissive`, `message_complex` and `title`
+        as keyword arguments; they are collected into a `BadgeSpec`
+        (or replace the fields of `spec`, when both are given).
+        An explicit `link` (a string, or a function of the keyword's value)
+        takes precedence over `BadgeSpec.link`.
+        """
+        if spec is None:
+            spec = BadgeSpec(**spec_kwargs)
+        elif spec_kwargs:
+            spec = _replace(spec, **spec_kwargs)
         if key not in self._schema:
             return
-        value = value if value is not None else self._schema[key]
+        value = spec.value if spec.value is not None else self._schema[key]
         badge_config = None
-        if not message:
-            if isinstance(value, bool):
-                message = str(value).lower()
-                badge_config = self._badge_config_permissive if (value is true_is_permissive) else self._badge_config_restrictive
-            elif isinstance(value, list):
-                message = " | ".join(value)
-            elif isinstance(value, (int, float, str)):
-                message = str(value)
-            else:
-                message = message_complex if isinstance(message_complex, str) else message_complex(value)
-        title = title if isinstance(title, str) or title is None else title(value)
+        if spec.message:
+            message = spec.message if isinstance(spec.message, str) else spec.message(value)
+        elif isinstance(value, bool):
+            message = str(value).lower()
+            badge_config = self._badge_config_permissive if (value is spec.true_is_permissive) else self._badge_config_restrictive
+        elif isinstance(value, list):
+            message = " | ".join(value)
+        elif isinstance(value, (int, float, str)):
+            message = str(value)
+        else:
+            message = spec.message_complex if isinstance(spec.message_complex, str) else spec.message_complex(value)
+        title_key = self._get_title_key(key)
+        if title_key in self._schema:
+            title = self._schema[title_key]
+        elif spec.title is None or isinstance(spec.title, str):
+            title = spec.title
+        elif isinstance(spec.title, dict):
+            title = spec.title[bool(value)]
+        else:
+            title = spec.title(value)
+        if link is not None:
+            link = link if isinstance(link, str) else link(value)
+        elif spec.link == "always" or (spec.link == "schema" and isinstance(value, dict)):
+            link = f"#{self._make_tag(key)}"
         return self._make_badge_kwargs(
             key=key,
-            message=message if isinstance(message, str) else message(value),
-            title=self._schema.get(self._get_title_key(key), title),
+            message=message,
+            title=title,
             config=badge_config,
-            link=link if isinstance(link, str) or link is None else link(value),
+            link=link,
         )
 
     def _make_badge_kwargs(
@@ -705,7 +783,12 @@ class DefaultPageGenerator:
             "alt": f"{label}: {message}" if label else message,
             "link": link,
             "title": title,
-        } | (config or {}) | self._badge_config_default.get(key, {})
+        }
+        if config:
+            kwargs.update(config)
+        key_config = self._badge_config_default.get(key)
+        if key_config:
+            kwargs.update(key_config)
         return kwargs
 
     def _make_tab_item_array(self, key: str, title: str | None = None) -> _mdit.element.TabItem | None:
@@ -762,18 +845,35 @@ class DefaultPageGenerator:
         )
 
     def _get_description_key(self, key: str):
-        return f"{self._keyword_description_prefix}{key}{self._keyword_description_suffix}"
+        try:
+            return self._description_key_cache[key]
+        except KeyError:
+            description_key = f"{self._keyword_description_prefix}{key}{self._keyword_description_suffix}"
+            self._description_key_cache[key] = description_key
+            return description_key
 
     def _get_title_key(self, key: str):
-        return f"{self._keyword_title_prefix}{key}{self._keyword_title_suffix}"
+        try:
+            return self._title_key_cache[key]
+        except KeyError:
+            title_key = f"{self._keyword_title_prefix}{key}{self._keyword_title_suffix}"
+            self._title_key_cache[key] = title_key
+            return title_key
 
     def _make_class_name(self, *parts):
-        return _pl.string.to_slug(f"{self._class_prefix}{"-".join(parts)}")
+        try:
+            return self._class_name_cache[parts]
+        except KeyError:
+            class_name = _to_slug(f"{self._class_prefix}{"-".join(parts)}")
+            self._class_name_cache[parts] = class_name
+            return class_name
 
     def _make_tag(self, *parts: str) -> str:
-        return _pl.string.to_slug(f"{self._schema_uri}-{"-".join(parts)}")
+        return _to_slug("-".join((self._schema_uri, *parts)))
 
     @staticmethod
     def _escape(content):
-        ascii_punctuation = r'!"#$%&\'()*+,\-./:;<=>?@[\\]^_`{|}~'
-        return _re.sub(f'([{_re.escape(ascii_punctuation)}])', r'\\\1', str(content))
+        return _ASCII_PUNCTUATION.sub(r'\\\1', str(content))
+
+
+DefaultPageGenerator._build_dispatch()